@@ -1,46 +1,215 @@
 """The IntesisHome integration."""
 from __future__ import annotations
 
-import asyncio
+from datetime import timedelta
+from functools import partial
 import logging
+import random
+
+from pyintesishome import IHAuthenticationError, IHConnectionError, IntesisHomeLocal
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 DOMAIN = "intesishome_local"
 PLATFORMS = ["climate"]
 
+UPDATE_INTERVAL = timedelta(seconds=30)
+# Poll less often while the controller is connected and pushing updates itself
+UPDATE_INTERVAL_PUSH = timedelta(minutes=5)
+UPDATE_INTERVAL_JITTER = 0.1
+
+RECONNECT_SECONDS = 30
+MAX_RETRIES = 10
+MAX_WAIT_TIME = 300
+
 _LOGGER = logging.getLogger(__name__)
 
+
+def _jittered(interval: timedelta) -> timedelta:
+    """Spread polls so that many controllers don't all fire at once."""
+    return interval * random.uniform(
+        1 - UPDATE_INTERVAL_JITTER, 1 + UPDATE_INTERVAL_JITTER
+    )
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up IntesisHome from a config entry."""
-    _LOGGER.info(f"Setting up {DOMAIN} integration for entry: %s", entry.entry_id)
+    _LOGGER.info("Setting up %s integration for entry: %s", DOMAIN, entry.entry_id)
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
 
-    try:
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    except Exception as e:
-        _LOGGER.error("Error setting up platforms for entry %s: %s", entry.entry_id, e)
+    # Reuse the controller already polled by the config flow if there is one
+    controller = hass.data[DOMAIN].get("controller", {}).pop(entry.unique_id, None)
+    if controller is None:
+        controller = IntesisHomeLocal(
+            entry.data.get(CONF_HOST),
+            entry.data.get(CONF_USERNAME),
+            entry.data.get(CONF_PASSWORD),
+            loop=hass.loop,
+            websession=async_get_clientsession(hass),
+        )
+
+        try:
+            await controller.poll_status()
+        except IHAuthenticationError:
+            _LOGGER.error("Invalid username or password")
+            await controller.stop()
+            return False
+        except IHConnectionError as ex:
+            _LOGGER.error("Error connecting to the %s API", DOMAIN)
+            raise ConfigEntryNotReady from ex
+
+    if not controller.get_devices():
+        _LOGGER.error(
+            "Error getting device list from %s API: %s",
+            DOMAIN,
+            controller.error_message,
+        )
+        await controller.stop()
         return False
 
+    # All of the entry's entities share one connection to the controller
+    try:
+        await controller.connect()
+    except IHConnectionError as ex:
+        _LOGGER.error("Exception connecting to IntesisHome: %s", ex)
+        await controller.stop()
+        raise ConfigEntryNotReady from ex
+
+    last_push = None
+    was_connected = False
+    reconnecting = False
+    unloaded = False
+    cancel_reconnect: CALLBACK_TYPE | None = None
+
+    async def async_try_connect(retries, _now=None):
+        """Reconnect to the controller, backing off between attempts."""
+        nonlocal reconnecting, cancel_reconnect
+        cancel_reconnect = None
+        if unloaded:
+            return
+        try:
+            await controller.connect()
+            _LOGGER.info("Reconnected to %s API", controller.device_type)
+        except IHConnectionError:
+            if unloaded:
+                # The entry was unloaded while this attempt was in progress
+                return
+            if retries < MAX_RETRIES:
+                wait_time = min(2**retries, MAX_WAIT_TIME)
+                _LOGGER.info(
+                    "Failed to reconnect to %s API. Retrying in %i seconds",
+                    controller.device_type,
+                    wait_time,
+                )
+                cancel_reconnect = async_call_later(
+                    hass, wait_time, partial(async_try_connect, retries + 1)
+                )
+                return
+            _LOGGER.error(
+                "Failed to reconnect to %s API after %i retries. Giving up",
+                controller.device_type,
+                MAX_RETRIES,
+            )
+        reconnecting = False
+
+    @callback
+    def async_cancel_reconnect():
+        """Cancel a pending reconnect attempt and prevent any new ones."""
+        nonlocal unloaded
+        unloaded = True
+        if cancel_reconnect is not None:
+            cancel_reconnect()
+
+    entry.async_on_unload(async_cancel_reconnect)
+
+    async def async_handle_push(device_id=None):
+        """Track pushed updates and reconnect once per dropped connection."""
+        nonlocal last_push, was_connected, reconnecting, cancel_reconnect
+        last_push = dt_util.utcnow()
+
+        connected = controller.is_connected
+        if was_connected and not connected and not reconnecting:
+            # All of the entry's entities share this controller, so only one
+            # reconnect chain is started here rather than one per entity
+            reconnecting = True
+            _LOGGER.info(
+                "Connection to %s API was lost. Reconnecting in %i seconds",
+                controller.device_type,
+                RECONNECT_SECONDS,
+            )
+            cancel_reconnect = async_call_later(
+                hass, RECONNECT_SECONDS, partial(async_try_connect, 0)
+            )
+        was_connected = connected
+
+        # Go back to normal polling straight away rather than after a long interval
+        if not connected and coordinator.update_interval > UPDATE_INTERVAL * (
+            1 + UPDATE_INTERVAL_JITTER
+        ):
+            coordinator.update_interval = _jittered(UPDATE_INTERVAL)
+            # Don't hold up the controller's callback loop waiting on the poll
+            entry.async_create_background_task(
+                hass,
+                coordinator.async_request_refresh(),
+                f"{DOMAIN} refresh after disconnect",
+            )
+
+    async def async_update_data():
+        """Poll the controller once for all of its devices."""
+        try:
+            await controller.poll_status()
+        except IHConnectionError as ex:
+            coordinator.update_interval = _jittered(UPDATE_INTERVAL)
+            raise UpdateFailed(f"Error communicating with the {DOMAIN} API") from ex
+
+        # Back off while pushed updates are arriving, poll normally otherwise
+        if (
+            controller.is_connected
+            and last_push is not None
+            and dt_util.utcnow() - last_push < 2 * UPDATE_INTERVAL_PUSH
+        ):
+            coordinator.update_interval = _jittered(UPDATE_INTERVAL_PUSH)
+        else:
+            coordinator.update_interval = _jittered(UPDATE_INTERVAL)
+
+    coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        config_entry=entry,
+        name=DOMAIN,
+        update_interval=_jittered(UPDATE_INTERVAL),
+        update_method=async_update_data,
+    )
+
+    controller.add_update_callback(async_handle_push)
+    entry.async_on_unload(
+        lambda: controller.remove_update_callback(async_handle_push)
+    )
+
+    hass.data[DOMAIN][entry.entry_id] = {
+        "controller": controller,
+        "coordinator": coordinator,
+    }
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    _LOGGER.info(f"Unloading {DOMAIN} integration for entry: %s", entry.entry_id)
-    try:
-        unload_ok = all(
-            await asyncio.gather(
-                *[hass.config_entries.async_forward_entry_unload(entry, platform) for platform in PLATFORMS]
-            )
-        )
-    except Exception as e:
-        _LOGGER.error("Error unloading platforms for entry %s: %s", entry.entry_id, e)
-        return False
+    _LOGGER.info("Unloading %s integration for entry: %s", DOMAIN, entry.entry_id)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # The controller is shared by all of the entry's entities, stop it once
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data["controller"].stop()
 
     return unload_ok
\ No newline at end of file
@@ -3,14 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import NamedTuple
-
-from pyintesishome import (
-    IHAuthenticationError,
-    IHConnectionError,
-    IntesisBase,
-    IntesisHomeLocal,
-)
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
 
 from homeassistant import config_entries, core
 from homeassistant.components.climate import ClimateEntity
@@ -23,43 +17,62 @@ from homeassistant.components.climate import (
     ClimateEntityFeature,
     HVACMode,
 )
-from homeassistant.const import (
-    ATTR_TEMPERATURE,
-    CONF_HOST,
-    CONF_PASSWORD,
-    CONF_USERNAME,
-    UnitOfTemperature,
-)
-from homeassistant.exceptions import PlatformNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 
 
 from . import DOMAIN
 
+if TYPE_CHECKING:
+    from pyintesishome import IntesisBase
+
 _LOGGER = logging.getLogger(__name__)
 
-MAP_IH_TO_HVAC_MODE = {
-    "auto": HVACMode.HEAT_COOL,
-    "cool": HVACMode.COOL,
-    "dry": HVACMode.DRY,
-    "fan": HVACMode.FAN_ONLY,
-    "heat": HVACMode.HEAT,
-    "off": HVACMode.OFF,
-}
-MAP_HVAC_MODE_TO_IH = {v: k for k, v in MAP_IH_TO_HVAC_MODE.items()}
+MAP_IH_TO_HVAC_MODE = MappingProxyType(
+    {
+        "auto": HVACMode.HEAT_COOL,
+        "cool": HVACMode.COOL,
+        "dry": HVACMode.DRY,
+        "fan": HVACMode.FAN_ONLY,
+        "heat": HVACMode.HEAT,
+        "off": HVACMode.OFF,
+    }
+)
+MAP_HVAC_MODE_TO_IH = MappingProxyType(
+    {
+        HVACMode.HEAT_COOL: "auto",
+        HVACMode.COOL: "cool",
+        HVACMode.DRY: "dry",
+        HVACMode.FAN_ONLY: "fan",
+        HVACMode.HEAT: "heat",
+        HVACMode.OFF: "off",
+    }
+)
 
-MAP_IH_TO_PRESET_MODE = {
-    "eco": PRESET_ECO,
-    "comfort": PRESET_COMFORT,
-    "powerful": PRESET_BOOST,
-}
-MAP_PRESET_MODE_TO_IH = {v: k for k, v in MAP_IH_TO_PRESET_MODE.items()}
+MAP_IH_TO_PRESET_MODE = MappingProxyType(
+    {
+        "eco": PRESET_ECO,
+        "comfort": PRESET_COMFORT,
+        "powerful": PRESET_BOOST,
+    }
+)
+MAP_PRESET_MODE_TO_IH = MappingProxyType(
+    {
+        PRESET_ECO: "eco",
+        PRESET_COMFORT: "comfort",
+        PRESET_BOOST: "powerful",
+    }
+)
 
-MAP_SWING_TO_IH = {
+# Vertical and horizontal vanes share positions, only "wide" is labelled differently
+_SWING_TO_IH = {
     SWING_OFF: "auto/stop",
     "Position 1": "manual1",
     "Position 2": "manual2",
@@ -72,26 +85,27 @@ MAP_SWING_TO_IH = {
     "Position 9": "manual9",
     "Swing": "swing",
     "Swirl": "swirl",
-    "wide": "wide",
 }
-MAP_IH_TO_SWING = {v: k for k, v in MAP_SWING_TO_IH.items()}
-
-MAP_HORIZONTAL_SWING_TO_IH = {
-    SWING_OFF: "auto/stop",
-    "Position 1": "manual1",
-    "Position 2": "manual2",
-    "Position 3": "manual3",
-    "Position 4": "manual4",
-    "Position 5": "manual5",
-    "Position 6": "manual6",
-    "Position 7": "manual7",
-    "Position 8": "manual8",
-    "Position 9": "manual9",
-    "Swing": "swing",
-    "Swirl": "swirl",
-    "Wide": "wide",
+_IH_TO_SWING = {
+    "auto/stop": SWING_OFF,
+    "manual1": "Position 1",
+    "manual2": "Position 2",
+    "manual3": "Position 3",
+    "manual4": "Position 4",
+    "manual5": "Position 5",
+    "manual6": "Position 6",
+    "manual7": "Position 7",
+    "manual8": "Position 8",
+    "manual9": "Position 9",
+    "swing": "Swing",
+    "swirl": "Swirl",
 }
-MAP_IH_TO_HORIZONTAL_SWING = {v: k for k, v in MAP_HORIZONTAL_SWING_TO_IH.items()}
+
+MAP_SWING_TO_IH = MappingProxyType({**_SWING_TO_IH, "wide": "wide"})
+MAP_IH_TO_SWING = MappingProxyType({**_IH_TO_SWING, "wide": "wide"})
+
+MAP_HORIZONTAL_SWING_TO_IH = MappingProxyType({**_SWING_TO_IH, "Wide": "wide"})
+MAP_IH_TO_HORIZONTAL_SWING = MappingProxyType({**_IH_TO_SWING, "wide": "Wide"})
 
 MAP_STATE_ICONS = {
     HVACMode.COOL: "mdi:snowflake",
@@ -101,82 +115,66 @@ MAP_STATE_ICONS = {
     HVACMode.HEAT_COOL: "mdi:cached",
 }
 
-MAX_RETRIES = 10
-MAX_WAIT_TIME = 300
+# Modes in which the unit has no temperature setpoint
+_NO_SETPOINT_MODES = frozenset({HVACMode.FAN_ONLY, HVACMode.OFF})
+
+_PRESET_LIST = (PRESET_ECO, PRESET_COMFORT, PRESET_BOOST)
+
+# Swing positions assumed for controllers that can't list their own
+_DEFAULT_SWING_LIST = ("Swing", "Position 1", "Position 2", "Position 3", "Position 4")
+
+
+class IHDeviceRecord(NamedTuple):
+    """The fields of a controller device entry used by the climate entity."""
+
+    name: str | None
+    climate_working_mode: bool | None
+
+    @classmethod
+    def from_device(cls, ih_device: dict[str, object]) -> IHDeviceRecord:
+        """Build a record from the controller's device dictionary."""
+        return cls(
+            name=ih_device.get("name"),
+            climate_working_mode=ih_device.get("climate_working_mode"),
+        )
 
 
 async def async_setup_entry(
     hass: core.HomeAssistant,
     config_entry: config_entries.ConfigEntry,
     async_add_entities: AddEntitiesCallback,
-) -> bool:
+) -> None:
     """Create climate entities from config flow."""
+    controller = hass.data[DOMAIN][config_entry.entry_id]["controller"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    if (
-        "controller" in hass.data[DOMAIN]
-        and config_entry.unique_id in hass.data[DOMAIN]["controller"]
-    ):
-        controller = hass.data[DOMAIN]["controller"].pop(config_entry.unique_id)
-        ih_devices = controller.get_devices()
-        if ih_devices:
-            async_add_entities(
-                [
-                    IntesisAC(ih_device_id, device, controller)
-                    for ih_device_id, device in ih_devices.items()
-                ],
-                update_before_add=False,
-            )
-        return True
-
-    controller = IntesisHomeLocal(
-        config_entry.data.get(CONF_HOST),
-        config_entry.data.get(CONF_USERNAME),
-        config_entry.data.get(CONF_PASSWORD),
-        loop=hass.loop,
-        websession=async_get_clientsession(hass),
-    )
-
-    try:
-        await controller.poll_status()
-    except IHAuthenticationError:
-        _LOGGER.error("Invalid username or password")
-        await controller.stop()
-        return False
-    except IHConnectionError as ex:
-        _LOGGER.error(f"Error connecting to the {DOMAIN} API")
-        raise PlatformNotReady from ex
-
-    if ih_devices := controller.get_devices():
-        async_add_entities(
-            [
-                IntesisAC(ih_device_id, device, controller)
-                for ih_device_id, device in ih_devices.items()
-            ],
-            update_before_add=False,
-        )
-        return True
-
-    _LOGGER.error(
-        f"Error getting device list from {DOMAIN} API: %s",
-        controller.error_message,
+    async_add_entities(
+        IntesisAC(ih_device_id, device, controller, coordinator)
+        for ih_device_id, device in controller.get_devices().items()
     )
-    await controller.stop()
-    return False
 
 
-class IntesisAC(ClimateEntity):
+class IntesisAC(CoordinatorEntity, ClimateEntity):
     """Represents an Intesishome air conditioning device."""
 
     _enable_turn_on_off_backwards_compatibility = False
 
-    def __init__(self, ih_device_id, ih_device, controller) -> None:
+    def __init__(
+        self,
+        ih_device_id,
+        ih_device,
+        controller,
+        coordinator: DataUpdateCoordinator,
+    ) -> None:
         """Initialize the thermostat."""
+        super().__init__(coordinator)
+        _LOGGER.debug("Adding climate device with state: %s", repr(ih_device))
         self._controller: IntesisBase = controller
         self._device_id: str = ih_device_id
-        self._ih_device: dict[str, dict[str, object]] = ih_device
-        self._device_name: str = ih_device.get("name")
+        self._ih_device: IHDeviceRecord = IHDeviceRecord.from_device(ih_device)
+        self._device_name: str = self._ih_device.name
         self._device_type: str = controller.device_type
-        self._connected: bool = False
+        self._connected: bool | None = None
         self._setpoint_step: float = 1.0
         self._current_temp: float = None
         self._max_temp: float = None
@@ -186,7 +184,7 @@ class IntesisAC(ClimateEntity):
         self._outdoor_temp: float = None
         self._hvac_mode: HVACMode = None
         self._preset: str = None
-        self._preset_list: list[str] = [PRESET_ECO, PRESET_COMFORT, PRESET_BOOST]
+        self._preset_list: tuple[str, ...] = _PRESET_LIST
         self._run_hours: int = None
         self._rssi = None
         self._swing_list: list[str] = []
@@ -195,64 +193,61 @@ class IntesisAC(ClimateEntity):
         self._hvane: str = None
         self._power: bool = False
         self._fan_speed = None
-        self._attr_supported_features = 0
+        self._features_resolved = False
         self._power_consumption_heat = None
         self._power_consumption_cool = None
+        self._attr_extra_state_attributes = {}
 
-        # On / off support
-        self._attr_supported_features |= ClimateEntityFeature.TURN_ON
-        self._attr_supported_features |= ClimateEntityFeature.TURN_OFF
-
-        # Setpoint support
-        if controller.has_setpoint_control(ih_device_id):
-            self._attr_supported_features |= ClimateEntityFeature.TARGET_TEMPERATURE
+        # Device info doesn't change for the lifetime of the entity
+        get_model = getattr(controller, "get_model", None)
+        get_fw_version = getattr(controller, "get_fw_version", None)
+        self._attr_device_info = DeviceInfo(
+            identifiers={
+                # Serial numbers are unique identifiers within a specific domain
+                (DOMAIN, controller.controller_id, ih_device_id)
+            },
+            name=self._device_name,
+            manufacturer=self._device_type.capitalize(),
+            model=get_model() if get_model else None,
+            sw_version=get_fw_version() if get_fw_version else None,
+        )
 
         # Setup swing lists
         if controller.has_vertical_swing():
             if hasattr(controller, "get_vertical_swing_list"):
-                if swingmodes := controller.get_vertical_swing_list():
-                    swingmode_list = []
-                    for swingmode in swingmodes:
-                        if swingmode in MAP_IH_TO_SWING:
-                            swingmode_list.append(MAP_IH_TO_SWING[swingmode])
-                        else:
-                            _LOGGER.warning(
-                                f"Unexpected vvane swingmode: {swingmode}, expected one of {MAP_IH_TO_SWING.keys()}"
-                            )
-                    self._swing_list.extend(swingmode_list)
+                swingmodes = controller.get_vertical_swing_list() or []
+                self._swing_list = [
+                    MAP_IH_TO_SWING[mode]
+                    for mode in swingmodes
+                    if mode in MAP_IH_TO_SWING
+                ]
+                if unexpected := set(swingmodes) - MAP_IH_TO_SWING.keys():
+                    _LOGGER.warning(
+                        "Unexpected vvane swingmodes: %s, expected one of %s",
+                        sorted(unexpected),
+                        list(MAP_IH_TO_SWING),
+                    )
             else:
-                self._swing_list.extend(
-                    ["Swing", "Position 1", "Position 2", "Position 3", "Position 4"]
-                )
+                self._swing_list = list(_DEFAULT_SWING_LIST)
         if controller.has_horizontal_swing():
             if hasattr(controller, "get_horizontal_swing_list"):
-                if swingmodes := controller.get_horizontal_swing_list():
-                    swingmode_list = []
-                    for swingmode in swingmodes:
-                        if swingmode in MAP_IH_TO_SWING:
-                            swingmode_list.append(MAP_IH_TO_HORIZONTAL_SWING[swingmode])
-                        else:
-                            _LOGGER.warning(
-                                f"Unexpected hvane swingmode: {swingmode}, expected one of {MAP_IH_TO_SWING.keys()}"
-                            )
-                    self._swing_horizontal_list.extend(swingmode_list)
+                swingmodes = controller.get_horizontal_swing_list() or []
+                self._swing_horizontal_list = [
+                    MAP_IH_TO_HORIZONTAL_SWING[mode]
+                    for mode in swingmodes
+                    if mode in MAP_IH_TO_HORIZONTAL_SWING
+                ]
+                if unexpected := set(swingmodes) - MAP_IH_TO_HORIZONTAL_SWING.keys():
+                    _LOGGER.warning(
+                        "Unexpected hvane swingmodes: %s, expected one of %s",
+                        sorted(unexpected),
+                        list(MAP_IH_TO_HORIZONTAL_SWING),
+                    )
             else:
-                self._swing_list.extend(
-                    ["Swing", "Position 1", "Position 2", "Position 3", "Position 4"]
-                )
-        if len(self._swing_list) > 0:
-            self._attr_supported_features |= ClimateEntityFeature.SWING_MODE
-        if len(self._swing_horizontal_list) > 0:
-            self._attr_supported_features |= ClimateEntityFeature.SWING_HORIZONTAL_MODE
+                self._swing_horizontal_list = list(_DEFAULT_SWING_LIST)
 
         # Setup fan speeds
         self._fan_modes = controller.get_fan_speed_list(ih_device_id)
-        if self._fan_modes:
-            self._attr_supported_features |= ClimateEntityFeature.FAN_MODE
-
-        # Preset support
-        if ih_device.get("climate_working_mode"):
-            self._attr_supported_features |= ClimateEntityFeature.PRESET_MODE
 
         # Setup HVAC modes
         if modes := controller.get_mode_list(ih_device_id):
@@ -265,16 +260,30 @@ class IntesisAC(ClimateEntity):
             self._attr_hvac_modes.extend(mode_list)
         self._attr_hvac_modes.append(HVACMode.OFF)
 
+        self._attr_supported_features = self._compute_features()
+
+    def _compute_features(self) -> ClimateEntityFeature:
+        """Work out the supported features from the controller's capabilities."""
+        features = ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
+        if self._controller.has_setpoint_control(self._device_id):
+            features |= ClimateEntityFeature.TARGET_TEMPERATURE
+        if self._swing_list:
+            features |= ClimateEntityFeature.SWING_MODE
+        if self._swing_horizontal_list:
+            features |= ClimateEntityFeature.SWING_HORIZONTAL_MODE
+        if self._fan_modes:
+            features |= ClimateEntityFeature.FAN_MODE
+        if self._ih_device.climate_working_mode:
+            features |= ClimateEntityFeature.PRESET_MODE
+        return features
+
     async def async_added_to_hass(self):
         """Subscribe to event updates."""
-        _LOGGER.debug("Added climate device with state: %s", repr(self._ih_device))
+        await super().async_added_to_hass()
         self._controller.add_update_callback(self.async_update_callback)
 
-        try:
-            await self._controller.connect()
-        except IHConnectionError as ex:
-            _LOGGER.error("Exception connecting to IntesisHome: %s", ex)
-            raise PlatformNotReady from ex
+        # Populate the initial state from the controller's last poll
+        self._handle_coordinator_update()
 
     @property
     def name(self):
@@ -286,23 +295,6 @@ class IntesisAC(ClimateEntity):
         """Intesishome API uses celsius on the backend."""
         return UnitOfTemperature.CELSIUS
 
-    @property
-    def extra_state_attributes(self):
-        """Return the device specific state attributes."""
-        attrs = {}
-        if self._outdoor_temp is not None:
-            attrs["outdoor_temp"] = self._outdoor_temp
-        if self._power_consumption_heat:
-            attrs["power_consumption_heat_kw"] = round(
-                self._power_consumption_heat / 1000, 1
-            )
-        if self._power_consumption_cool:
-            attrs["power_consumption_cool_kw"] = round(
-                self._power_consumption_cool / 1000, 1
-            )
-
-        return attrs
-
     @property
     def unique_id(self):
         """Return unique ID for this device."""
@@ -345,22 +337,26 @@ class IntesisAC(ClimateEntity):
         if hvac_mode := kwargs.get(ATTR_HVAC_MODE):
             await self.async_set_hvac_mode(hvac_mode)
 
+        prev_target_temp = self._target_temp
         if temperature := kwargs.get(ATTR_TEMPERATURE):
             _LOGGER.debug("Setting %s to %s degrees", self._device_type, temperature)
             await self._controller.set_temperature(self._device_id, temperature)
             self._target_temp = temperature
 
         # Write updated temperature to HA state to avoid flapping (API confirmation is slow)
-        self.async_write_ha_state()
+        if self._target_temp != prev_target_temp:
+            self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set operation mode."""
         _LOGGER.debug("Setting %s to %s mode", self._device_type, hvac_mode)
+        prev_hvac_mode = self.hvac_mode
         if hvac_mode == HVACMode.OFF:
             self._power = False
             await self._controller.set_power_off()
             # Write changes to HA, API can be slow to push changes
-            self.async_write_ha_state()
+            if prev_hvac_mode != HVACMode.OFF:
+                self.async_write_ha_state()
             return
 
         # First check device is turned on
@@ -372,20 +368,23 @@ class IntesisAC(ClimateEntity):
         await self._controller.set_mode(self._device_id, MAP_HVAC_MODE_TO_IH[hvac_mode])
 
         # Send the temperature again in case changing modes has changed it
-        if self._target_temp:
+        if self._target_temp and hvac_mode != prev_hvac_mode:
             await self._controller.set_temperature(self._device_id, self._target_temp)
 
         # Updates can take longer than 2 seconds, so update locally
         self._hvac_mode = hvac_mode
-        self.async_write_ha_state()
+        if hvac_mode != prev_hvac_mode:
+            self.async_write_ha_state()
 
     async def async_set_fan_mode(self, fan_mode):
         """Set fan mode (from quiet, low, medium, high, auto)."""
+        prev_fan_speed = self._fan_speed
         await self._controller.set_fan_speed(self._device_id, fan_mode)
 
         # Updates can take longer than 2 seconds, so update locally
         self._fan_speed = fan_mode
-        self.async_write_ha_state()
+        if fan_mode != prev_fan_speed:
+            self.async_write_ha_state()
 
     async def async_set_preset_mode(self, preset_mode):
         """Set preset mode."""
@@ -402,112 +401,101 @@ class IntesisAC(ClimateEntity):
         if swingmode := MAP_HORIZONTAL_SWING_TO_IH.get(swing_mode):
             await self._controller.set_horizontal_vane(self._device_id, swingmode)
 
-    async def async_update(self):
+    @callback
+    def _handle_coordinator_update(self) -> None:
         """Copy values from controller dictionary to climate device."""
-        # Update values from controller's device dictionary
-        self._connected = self._controller.is_connected
-        self._current_temp = self._controller.get_temperature(self._device_id)
-        self._fan_speed = self._controller.get_fan_speed(self._device_id)
-        self._power = self._controller.is_on(self._device_id)
-        self._min_temp = self._controller.get_min_setpoint(self._device_id)
-        self._max_temp = self._controller.get_max_setpoint(self._device_id)
-        self._rssi = self._controller.get_rssi(self._device_id)
-        self._run_hours = self._controller.get_run_hours(self._device_id)
-        self._target_temp = self._controller.get_setpoint(self._device_id)
-        self._outdoor_temp = self._controller.get_outdoor_temperature(self._device_id)
+        # Bind the controller and device id locally for the getter calls below
+        controller = self._controller
+        device_id = self._device_id
+
+        self._connected = controller.is_connected
+        self._current_temp = controller.get_temperature(device_id)
+        self._fan_speed = controller.get_fan_speed(device_id)
+        self._power = controller.is_on(device_id)
+        self._min_temp = controller.get_min_setpoint(device_id)
+        self._max_temp = controller.get_max_setpoint(device_id)
+        self._rssi = controller.get_rssi(device_id)
+        self._run_hours = controller.get_run_hours(device_id)
+        self._target_temp = controller.get_setpoint(device_id)
+
+        # Outdoor temperature, only touch the state attributes when it changes
+        outdoor_temp = controller.get_outdoor_temperature(device_id)
+        if outdoor_temp != self._outdoor_temp:
+            self._outdoor_temp = outdoor_temp
+            if outdoor_temp is not None:
+                self._attr_extra_state_attributes["outdoor_temp"] = outdoor_temp
+            else:
+                self._attr_extra_state_attributes.pop("outdoor_temp", None)
 
         # Operation mode
-        mode = self._controller.get_mode(self._device_id)
+        mode = controller.get_mode(device_id)
         self._hvac_mode = MAP_IH_TO_HVAC_MODE.get(mode)
 
         # Preset mode
-        preset = self._controller.get_preset_mode(self._device_id)
+        preset = controller.get_preset_mode(device_id)
         self._preset = MAP_IH_TO_PRESET_MODE.get(preset)
 
         # Swing mode
-        self._vvane = self._controller.get_vertical_swing(self._device_id)
-        self._hvane = self._controller.get_horizontal_swing(self._device_id)
+        self._vvane = controller.get_vertical_swing(device_id)
+        self._hvane = controller.get_horizontal_swing(device_id)
+
+        # Power usage, only recalculate the state attributes when it changes
+        heat_power = controller.get_heat_power_consumption(device_id)
+        if heat_power != self._power_consumption_heat:
+            self._power_consumption_heat = heat_power
+            self._update_power_attribute("power_consumption_heat_kw", heat_power)
+        cool_power = controller.get_cool_power_consumption(device_id)
+        if cool_power != self._power_consumption_cool:
+            self._power_consumption_cool = cool_power
+            self._update_power_attribute("power_consumption_cool_kw", cool_power)
+
+        # Capabilities may only be complete once the first update has arrived
+        if not self._features_resolved:
+            self._attr_supported_features = self._compute_features()
+            self._features_resolved = True
 
-        # Power usage
-        self._power_consumption_heat = self._controller.get_heat_power_consumption(
-            self._device_id
-        )
-        self._power_consumption_cool = self._controller.get_cool_power_consumption(
-            self._device_id
-        )
+        self.async_write_ha_state()
 
-        if not self._attr_supported_features:
-            if self._fan_modes:
-                self._attr_supported_features |= ClimateEntityFeature.FAN_MODE
-            if self._controller.has_setpoint_control(self._device_id):
-                self._attr_supported_features |= ClimateEntityFeature.TARGET_TEMPERATURE
-            if len(self._swing_list) > 0:
-                self._attr_supported_features |= ClimateEntityFeature.SWING_MODE
-            if len(self._swing_horizontal_list) > 0:
-                self._attr_supported_features |= (
-                    ClimateEntityFeature.SWING_HORIZONTAL_MODE
-                )
-            if self._ih_device.get("climate_working_mode"):
-                self._attr_supported_features |= ClimateEntityFeature.PRESET_MODE
+    def _update_power_attribute(self, key: str, watts) -> None:
+        """Store a power reading in kW, or drop it if the device reports none."""
+        if watts:
+            self._attr_extra_state_attributes[key] = round(watts / 1000, 1)
+        else:
+            self._attr_extra_state_attributes.pop(key, None)
 
     async def async_will_remove_from_hass(self):
-        """Shutdown the controller when the device is being removed."""
+        """Stop listening for controller updates when the device is being removed."""
         self._controller.remove_update_callback(self.async_update_callback)
-        await self._controller.stop()
-        self._controller = None
 
     @property
     def icon(self):
         """Return the icon for the current state."""
-        icon = None
-        if self._power:
-            icon = MAP_STATE_ICONS.get(self._hvac_mode)
-        return icon
+        if not self._power:
+            return None
+        return MAP_STATE_ICONS.get(self._hvac_mode)
 
     async def async_update_callback(self, device_id=None):
         """Let HA know there has been an update from the controller."""
         # Track changes in connection state
-        if self._controller and not self._controller.is_connected and self._connected:
-            # Connection has dropped
+        connected = self._controller.is_connected
+        was_connected = self._connected
+        connection_changed = False
+        if not connected and was_connected is True:
+            # Connection has dropped, the integration schedules the reconnect
             self._connected = False
-            reconnect_seconds = 30
-
-            _LOGGER.info(
-                "Connection to %s API was lost. Reconnecting in %i seconds",
-                self._device_type,
-                reconnect_seconds,
-            )
-
-            async def try_connect(retries):
-                try:
-                    await self._controller.connect()
-                    _LOGGER.info("Reconnected to %s API", self._device_type)
-                except IHConnectionError:
-                    if retries < MAX_RETRIES:
-                        wait_time = min(2**retries, MAX_WAIT_TIME)
-                        _LOGGER.info(
-                            "Failed to reconnect to %s API. Retrying in %i seconds",
-                            self._device_type,
-                            wait_time,
-                        )
-                        async_call_later(self.hass, wait_time, try_connect(retries + 1))
-                    else:
-                        _LOGGER.error(
-                            "Failed to reconnect to %s API after %i retries. Giving up",
-                            self._device_type,
-                            MAX_RETRIES,
-                        )
-
-                async_call_later(self.hass, reconnect_seconds, try_connect(0))
-
-        if self._controller.is_connected and not self._connected:
+            connection_changed = True
+        elif connected and not was_connected:
             # Connection has been restored
             self._connected = True
+            connection_changed = True
             _LOGGER.debug("Connection to %s API was restored", self._device_type)
 
-        if not device_id or self._device_id == device_id:
+        if device_id is None or self._device_id == device_id:
             # Update all devices if no device_id was specified
-            self.async_schedule_update_ha_state(True)
+            self._handle_coordinator_update()
+        elif connection_changed:
+            # Only availability changed for this device
+            self.async_write_ha_state()
 
     @property
     def min_temp(self):
@@ -519,11 +507,6 @@ class IntesisAC(ClimateEntity):
         """Return the maximum temperature for the current mode of operation."""
         return self._max_temp
 
-    @property
-    def should_poll(self):
-        """Poll for updates if pyIntesisHome doesn't have a socket open."""
-        return True
-
     @property
     def fan_mode(self):
         """Return whether the fan is on."""
@@ -531,27 +514,17 @@ class IntesisAC(ClimateEntity):
 
     @property
     def swing_mode(self):
-        if self._vvane is None:
-            return None
-        swing = MAP_IH_TO_SWING.get(self._vvane)
-        if swing is None:
-            return None
-        try:
-            return swing
-        except ValueError:
-            return None
+        """Return the current vertical swing position."""
+        return None if self._vvane is None else MAP_IH_TO_SWING.get(self._vvane)
 
     @property
     def swing_horizontal_mode(self):
-        if self._vvane is None:
-            return None
-        swing = MAP_IH_TO_SWING.get(self._hvane)
-        if swing is None:
-            return None
-        try:
-            return swing
-        except ValueError:
-            return None
+        """Return the current horizontal swing position."""
+        return (
+            None
+            if self._hvane is None
+            else MAP_IH_TO_HORIZONTAL_SWING.get(self._hvane)
+        )
 
     @property
     def fan_modes(self):
@@ -588,26 +561,6 @@ class IntesisAC(ClimateEntity):
     @property
     def target_temperature(self) -> float | None:
         """Return the current setpoint temperature if unit is on."""
-        if self._power and self.hvac_mode not in [HVACMode.FAN_ONLY, HVACMode.OFF]:
+        if self._power and self.hvac_mode not in _NO_SETPOINT_MODES:
             return self._target_temp
         return None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        controller_model = None
-        controller_fw_version = None
-        if hasattr(self._controller, "get_model"):
-            controller_model = self._controller.get_model()
-        if hasattr(self._controller, "get_fw_version"):
-            controller_fw_version = self._controller.get_fw_version()
-        return DeviceInfo(
-            identifiers={
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self._controller.controller_id, self._device_id)
-            },
-            name=self._device_name,
-            manufacturer=self._device_type.capitalize(),
-            model=controller_model,
-            sw_version=controller_fw_version,
-        )